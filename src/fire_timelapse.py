@@ -13,25 +13,38 @@ import argparse
 import asyncio
 import hashlib
 import json
+import math
+import multiprocessing
 import os
+import queue
+import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from fractions import Fraction
 from pathlib import Path
-from io import StringIO
+from io import BytesIO
 
 import geopandas as gpd
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering (also inherited by render worker processes)
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib import font_manager
 from matplotlib.colors import LinearSegmentedColormap
-import seaborn as sns
-import requests
-import imageio.v3 as iio
-from shapely.geometry import Point, box
+import aiohttp
+import av
+import numpy as np
+import pyarrow as pa
+import shapely
+from pyarrow import csv as pacsv
 from tqdm import tqdm
 from PIL import Image
+from numba import njit, prange
+from scipy.ndimage import gaussian_filter
 
 try:
     import contextily as cx
@@ -53,9 +66,61 @@ CACHE_DIR = Path(".cache")
 FRAMES_DIR = Path("outputs/frames")
 VIDEOS_DIR = Path("outputs/videos")
 
-# Rate limiting for API requests (now using sequential processing)
-_last_api_call_time = None
-API_CALL_DELAY = 0.3  # Minimum seconds between API calls - conservative but not too slow
+# Rate limiting for API requests
+API_CALL_DELAY = 0.3  # Minimum seconds between API call starts - conservative but not too slow
+API_MAX_CONCURRENCY = 8  # Maximum API requests in flight at once
+
+# Largest AOI ring (vertex count) clipped with the compiled crossing test instead of sjoin
+PIP_MAX_VERTICES = 100
+
+# FIRMS CSV columns used downstream (the rest are skipped at parse time) and their types.
+# Coordinates stay float64 so points on AOI edges are classified exactly.
+FIRMS_USECOLS = ['latitude', 'longitude', 'acq_date', 'acq_time', 'satellite', 'frp', 'daynight']
+FIRMS_DTYPES = {
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'acq_time': 'int16',
+    'satellite': 'category',
+    'daynight': 'category',
+    'frp': 'float32',
+}
+FIRMS_ARROW_TYPES = {
+    'latitude': pa.float64(),
+    'longitude': pa.float64(),
+    'acq_date': pa.timestamp('s'),
+    'acq_time': pa.int16(),
+    'satellite': pa.dictionary(pa.int32(), pa.string()),
+    'daynight': pa.dictionary(pa.int32(), pa.string()),
+    'frp': pa.float32(),
+}
+
+# Columns that uniquely identify a FIRMS detection
+FIRMS_KEY_COLUMNS = ['latitude', 'longitude', 'acq_date', 'acq_time', 'satellite']
+
+# H.264 encoder settings (hardware encoders are used automatically when available)
+VIDEO_CODEC_OPTIONS = {
+    # Throughput-oriented: faster preset, tuned for the mostly static map content
+    'libx264': {'preset': 'faster', 'tune': 'stillimage', 'crf': '20'},
+    'h264_nvenc': {'preset': 'p4', 'rc': 'vbr', 'cq': '23'},
+    'h264_videotoolbox': {'realtime': '0', 'allow_sw': '1'},
+}
+
+# Minimum frames per render worker process. Each worker re-imports the
+# geospatial/numba/matplotlib stack and rebuilds the figure (~2s of startup), so
+# short runs (e.g. under ~50 monthly frames) render faster in-process
+MIN_FRAMES_PER_WORKER = 25
+
+# Heatmap density grid resolution (cells per side, matches the colormap's 256 colors)
+KDE_GRID_SIZE = 256
+
+# Matplotlib settings for frame rendering: frames are low-DPI video stills, so trade
+# publication-quality path/text detail for less Agg work per frame
+FRAME_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,  # drop line vertices within 1px of the path
+    'agg.path.chunksize': 10000,     # rasterize very long paths in pieces
+    'text.hinting': 'none',
+}
 
 # Custom heatmap colormap: 10-color gradient from colleague's style reference
 # Dark blue held longer (0-20%), cream introduced sooner (90%)
@@ -165,8 +230,19 @@ def get_bounding_box(aoi, buffer_km=25):
     Returns:
         str: Bounding box as 'west,south,east,north'
     """
-    # Get the centroid of the AOI for creating a custom projection
-    aoi_centroid = aoi.unary_union.centroid
+    minx, miny, maxx, maxy = aoi.total_bounds
+
+    # Small/mid-latitude AOIs: pad the bounds directly using km-per-degree on a
+    # local tangent plane. Latitude uses the shortest meridian degree (110.574 km)
+    # and longitude the latitude furthest from the equator, so the box always
+    # covers the true buffer.
+    if (maxy - miny) <= 5.0 and max(abs(miny), abs(maxy)) <= 80.0:
+        dlat = buffer_km / 110.574
+        dlon = buffer_km / (111.32 * math.cos(math.radians(max(abs(miny - dlat), abs(maxy + dlat)))))
+        return f"{minx - dlon},{miny - dlat},{maxx + dlon},{maxy + dlat}"
+
+    # Large or polar AOIs: buffer accurately in a projection centered on the AOI
+    aoi_centroid = aoi.union_all().centroid
     lon, lat = aoi_centroid.x, aoi_centroid.y
 
     # Create a custom Azimuthal Equidistant projection centered on the AOI
@@ -176,8 +252,7 @@ def get_bounding_box(aoi, buffer_km=25):
     # Project to custom CRS, buffer in meters, then project back to WGS84
     aoi_projected = aoi.to_crs(custom_crs)
     aoi_buffered = aoi_projected.buffer(buffer_km * 1000)  # Convert km to meters
-    aoi_buffered_gdf = gpd.GeoDataFrame(geometry=aoi_buffered, crs=custom_crs)
-    aoi_buffered_wgs84 = aoi_buffered_gdf.to_crs("EPSG:4326")
+    aoi_buffered_wgs84 = aoi_buffered.to_crs("EPSG:4326")
 
     # Get bounding box of buffered AOI
     bounds = aoi_buffered_wgs84.total_bounds  # [minx, miny, maxx, maxy]
@@ -199,111 +274,267 @@ def generate_date_chunks(start_date, end_date, chunk_size=10, max_total_days=Non
     """
     # If max_total_days specified, break into year-sized batches
     if max_total_days and (end_date - start_date).days > max_total_days:
-        batch_start = start_date
-        while batch_start <= end_date:
+        for batch_start in pd.date_range(start_date, end_date, freq=f'{max_total_days}D'):
             batch_end = min(batch_start + timedelta(days=max_total_days - 1), end_date)
             # Recursively generate chunks for this batch
-            for chunk_start, chunk_end, day_range in generate_date_chunks(batch_start, batch_end, chunk_size, None):
-                yield chunk_start, chunk_end, day_range
-            batch_start = batch_end + timedelta(days=1)
+            yield from generate_date_chunks(batch_start, batch_end, chunk_size, None)
         return
 
-    current = start_date
-    while current <= end_date:
-        chunk_end = min(current + timedelta(days=chunk_size - 1), end_date)
-        day_range = (chunk_end - current).days + 1
+    chunk_starts = pd.date_range(start_date, end_date, freq=f'{chunk_size}D')
+    chunk_ends = chunk_starts + pd.Timedelta(days=chunk_size - 1)
+    chunk_ends = chunk_ends.where(chunk_ends <= end_date, pd.Timestamp(end_date))
+    day_ranges = (chunk_ends - chunk_starts).days + 1
 
-        yield current, chunk_end, day_range
+    yield from zip(chunk_starts, chunk_ends, day_ranges.tolist())
 
-        current = chunk_end + timedelta(days=1)
 
-
-def get_cache_path(url):
+def get_cache_path(url, cache_format='parquet'):
     """
     Generate cache file path based on URL hash.
 
     Args:
         url (str): API URL
+        cache_format (str): Cache file format - 'parquet' or 'csv'
 
     Returns:
         Path: Path to cache file
     """
     url_hash = hashlib.md5(url.encode()).hexdigest()
-    return CACHE_DIR / f"{url_hash}.csv"
+    return CACHE_DIR / f"{url_hash}.{cache_format}"
 
 
-def fetch_single_chunk(args):
-    """Fetch a single chunk of data (used for parallel processing)."""
-    chunk_start, chunk_end, day_range, map_key, bbox, use_cache = args
+def get_chunk_url(args):
+    """
+    Build the API URL for a chunk.
 
+    Args:
+        args (tuple): (chunk_start, chunk_end, day_range, map_key, bbox, use_cache, cache_format)
+
+    Returns:
+        str: API URL
+    """
+    chunk_start, _, day_range, map_key, bbox = args[:5]
     date_str = chunk_start.strftime("%Y-%m-%d")
-    url = f"{API_BASE_URL}/{map_key}/{SOURCE}/{bbox}/{day_range}/{date_str}"
-    cache_path = get_cache_path(url)
+    return f"{API_BASE_URL}/{map_key}/{SOURCE}/{bbox}/{day_range}/{date_str}"
 
-    # Check cache first
-    if use_cache and cache_path.exists():
-        try:
+
+class RateLimiter:
+    """Async limiter that enforces a minimum gap between successive API calls."""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._last = None
+
+    async def acquire(self):
+        """Wait until the next API call slot is available."""
+        async with self._lock:
+            if self._last is not None:
+                wait = self._last + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last = time.monotonic()
+
+
+def read_firms_csv(source):
+    """
+    Parse a FIRMS CSV response, keeping only the columns used downstream.
+
+    Uses pyarrow's multi-threaded CSV reader (unused columns are skipped by the
+    parser itself), falling back to pandas if pyarrow rejects the input.
+
+    Args:
+        source (str | Path | BytesIO): CSV file path or buffer
+
+    Returns:
+        pd.DataFrame: Typed FIRMS records with acq_date parsed to datetime
+    """
+    try:
+        table = pacsv.read_csv(source, convert_options=pacsv.ConvertOptions(
+            include_columns=FIRMS_USECOLS, column_types=FIRMS_ARROW_TYPES))
+        return table.to_pandas()
+    except pa.ArrowException:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pd.read_csv(source, usecols=FIRMS_USECOLS, dtype=FIRMS_DTYPES, parse_dates=['acq_date'])
+
+
+def read_cached_chunk(cache_path):
+    """
+    Read a cached API response.
+
+    Parquet caches mark "No data" responses with a sibling .empty file; CSV caches
+    store the literal text "No data".
+
+    Args:
+        cache_path (Path): Path to cache file
+
+    Returns:
+        tuple: (df, hit) - cached DataFrame (None for "No data") and whether the cache was usable
+    """
+    try:
+        if cache_path.suffix == '.parquet':
+            if cache_path.with_suffix('.empty').exists():
+                return None, True
+            if cache_path.exists():
+                return pd.read_parquet(cache_path, engine='pyarrow', columns=FIRMS_USECOLS), True
+            return None, False
+
+        if cache_path.exists():
             content = cache_path.read_text()
             if content == "No data":
-                return None, True, False, None  # None, from_cache, api_called, error
-            df = pd.read_csv(cache_path)
-            return df, True, False, None
-        except Exception:
-            pass  # Fall through to API call
+                return None, True
+            return read_firms_csv(str(cache_path)), True
+        return None, False
+    except Exception:
+        return None, False  # Fall through to API call
+
+
+def write_cached_chunk(cache_path, df):
+    """
+    Write an API response to the cache.
+
+    Args:
+        cache_path (Path): Path to cache file
+        df (pd.DataFrame): Response data, or None for a "No data" response
+    """
+    if cache_path.suffix == '.parquet':
+        if df is None:
+            cache_path.with_suffix('.empty').touch()
+        else:
+            df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+    elif df is None:
+        cache_path.write_text("No data")
+    else:
+        df.to_csv(cache_path, index=False)
+
+
+async def fetch_single_chunk_async(session, sem, limiter, args):
+    """
+    Fetch a single chunk of data from the API (used for concurrent processing).
+
+    Returns:
+        tuple: (df, error) - df is None for "No data" or failed chunks; error is None on success
+    """
+    use_cache, cache_format = args[-2:]
+    url = get_chunk_url(args)
+    cache_path = get_cache_path(url, cache_format)
 
     # Make API request with retries
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            # Global rate limiting - ensure minimum delay between API calls
-            global _last_api_call_time
-            if _last_api_call_time is not None:
-                elapsed = time.time() - _last_api_call_time
-                if elapsed < API_CALL_DELAY:
-                    time.sleep(API_CALL_DELAY - elapsed)
-            _last_api_call_time = time.time()
-
             # Add small delay to respect API rate limits
             if attempt > 0:
-                time.sleep(1 + attempt)  # Increasing delay on retries
+                await asyncio.sleep(1 + attempt)  # Increasing delay on retries
 
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            # Bound in-flight requests and space call starts by API_CALL_DELAY
+            async with sem:
+                await limiter.acquire()
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    body = await response.read()
 
             # Handle "No data" response
-            if response.text.strip().lower() == "no data":
+            if body.strip().lower() == b"no data":
                 if use_cache:
-                    cache_path.write_text("No data")
-                return None, False, True, None
+                    write_cached_chunk(cache_path, None)
+                return None, None  # data, error
 
-            # Parse CSV response
-            df = pd.read_csv(StringIO(response.text))
+            # Parse CSV response off the event loop
+            try:
+                df = await asyncio.to_thread(read_firms_csv, BytesIO(body))
+            except (ValueError, pa.ArrowException):
+                # A 200 response that isn't FIRMS CSV (e.g. "Invalid MAP_KEY."); not
+                # transient, so fail this chunk without retrying
+                message = body[:100].decode(errors='replace').strip()
+                return None, f"Unexpected API response: {message}"
 
             if not df.empty:
                 # Cache the response
                 if use_cache:
-                    df.to_csv(cache_path, index=False)
-                return df, False, True, None
+                    write_cached_chunk(cache_path, df)
+                return df, None
 
-            return None, False, True, None
+            return None, None
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             if attempt < max_retries - 1:
                 # Retry with exponential backoff - longer delays for 403 errors (rate limiting)
-                if "403" in str(e) or "Forbidden" in str(e):
+                if isinstance(e, aiohttp.ClientResponseError) and e.status == 403:
                     delay = 5 * (2 ** attempt)  # 5, 10, 20 seconds for rate limit errors
                 else:
                     delay = 2 ** attempt  # 1, 2, 4 seconds for other errors
-                time.sleep(delay)
+                await asyncio.sleep(delay)
                 continue
             else:
                 # All retries failed
-                return None, False, True, f"Failed after {max_retries} attempts: {str(e)}"
+                return None, f"Failed after {max_retries} attempts: {str(e) or type(e).__name__}"
+
+
+async def fetch_chunks_async(chunk_args):
+    """
+    Fetch chunks concurrently while honoring the API rate limit.
+
+    Args:
+        chunk_args (list): Argument tuples for fetch_single_chunk_async
+
+    Returns:
+        list: (df, error) tuples in the same order as chunk_args
+    """
+    sem = asyncio.Semaphore(API_MAX_CONCURRENCY)
+    limiter = RateLimiter(API_CALL_DELAY)
 
+    async with aiohttp.ClientSession() as session:
+        with tqdm(total=len(chunk_args), desc="Fetching API data", unit="chunk") as pbar:
+            async def fetch(chunk_arg):
+                result = await fetch_single_chunk_async(session, sem, limiter, chunk_arg)
+                pbar.update(1)
+                return result
 
-def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False):
+            return await asyncio.gather(*(fetch(chunk_arg) for chunk_arg in chunk_args))
+
+
+def drop_duplicate_detections(df):
+    """
+    Drop repeated fire detections, keeping the first occurrence.
+
+    Latitude, longitude, date and time are packed into one uint64 key per row, so
+    finding candidate duplicates is a single vectorized pass. Only rows whose key
+    repeats are compared exactly on FIRMS_KEY_COLUMNS; duplicates are rare, so the
+    wide all-column row hashing is avoided.
+
+    Args:
+        df (pd.DataFrame): Combined FIRMS records
+
+    Returns:
+        pd.DataFrame: Records with duplicate detections removed
+    """
+    if not set(FIRMS_KEY_COLUMNS).issubset(df.columns):
+        return df.drop_duplicates()
+
+    df = df.reset_index(drop=True)
+
+    # Packed key (lat 21 bits | lon 22 bits | date 9 bits | time 12 bits); lossy, so
+    # key collisions are only candidates and are resolved exactly below
+    lat = np.rint((df['latitude'].to_numpy(dtype=np.float64) + 90) * 1e4).astype(np.uint64)
+    lon = np.rint((df['longitude'].to_numpy(dtype=np.float64) + 180) * 1e4).astype(np.uint64)
+    day = pd.factorize(df['acq_date'])[0].astype(np.uint64) & np.uint64(0x1FF)
+    tm = df['acq_time'].to_numpy().astype(np.uint64) & np.uint64(0xFFF)
+    key = (lat << np.uint64(43)) | (lon << np.uint64(21)) | (day << np.uint64(12)) | tm
+
+    candidates = pd.Series(key).duplicated(keep=False).to_numpy()
+    if not candidates.any():
+        return df
+
+    keep = ~candidates
+    keep[df.loc[candidates].drop_duplicates(subset=FIRMS_KEY_COLUMNS).index] = True
+    return df.loc[keep].reset_index(drop=True)
+
+
+def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False, cache_format='parquet'):
     """
-    Fetch fire data from NASA FIRMS API in 10-day chunks using parallel requests.
+    Fetch fire data from NASA FIRMS API in 10-day chunks using concurrent requests.
     Automatically processes in yearly batches to avoid API limitations.
 
     Args:
@@ -312,6 +543,7 @@ def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False):
         start_date (datetime): Start date
         end_date (datetime): End date
         use_cache (bool): Whether to use cached responses
+        cache_format (str): Cache file format - 'parquet' (default) or 'csv'
 
     Returns:
         pd.DataFrame: Combined fire data from all chunks
@@ -326,8 +558,8 @@ def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False):
     if use_cache:
         CACHE_DIR.mkdir(exist_ok=True)
 
-    # Prepare arguments for parallel processing
-    chunk_args = [(chunk_start, chunk_end, day_range, map_key, bbox, use_cache)
+    # Prepare arguments for concurrent processing
+    chunk_args = [(chunk_start, chunk_end, day_range, map_key, bbox, use_cache, cache_format)
                   for chunk_start, chunk_end, day_range in chunks]
 
     all_data = []
@@ -335,24 +567,33 @@ def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False):
     api_calls = 0
     errors = []
 
-    # Process API requests SEQUENTIALLY to ensure 100% reliability
-    # Parallel requests were causing 403 rate limit errors and data loss
-    # Slower but guarantees complete data retrieval
-    print("Processing requests sequentially for maximum reliability...")
-
-    for chunk_arg in tqdm(chunk_args, desc="Fetching API data", unit="chunk"):
-        df, from_cache, api_called, error = fetch_single_chunk(chunk_arg)
+    # Serve cache hits synchronously; only the misses go to the network
+    pending = []
+    for chunk_arg in chunk_args:
+        if use_cache:
+            df, hit = read_cached_chunk(get_cache_path(get_chunk_url(chunk_arg), cache_format))
+            if hit:
+                cache_hits += 1
+                if df is not None:
+                    all_data.append(df)
+                continue
+        pending.append(chunk_arg)
 
-        if df is not None:
-            all_data.append(df)
+    # Issue API requests concurrently, gated by a semaphore and a global rate limiter.
+    # Requests still start at most once every API_CALL_DELAY seconds to avoid 403s,
+    # but network latency of in-flight requests overlaps instead of adding up.
+    if pending:
+        print(f"Requesting {len(pending)} chunk(s) with up to {API_MAX_CONCURRENCY} in flight...")
+        results = asyncio.run(fetch_chunks_async(pending))
 
-        if error:
-            errors.append((chunk_arg[0], chunk_arg[1], error))
+        # Cache hits were served above, so every pending chunk is an API call
+        api_calls = len(pending)
+        for chunk_arg, (df, error) in zip(pending, results):
+            if df is not None:
+                all_data.append(df)
 
-        if from_cache:
-            cache_hits += 1
-        if api_called:
-            api_calls += 1
+            if error:
+                errors.append((chunk_arg[0], chunk_arg[1], error))
 
     if not all_data:
         print("\nWarning: No fire data found for the specified date range and area")
@@ -362,7 +603,7 @@ def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False):
     combined_df = pd.concat(all_data, ignore_index=True)
 
     # Remove duplicates (overlapping dates in chunks)
-    combined_df = combined_df.drop_duplicates()
+    combined_df = drop_duplicate_detections(combined_df)
 
     print(f"\nCache statistics: {cache_hits} hits, {api_calls} API calls")
     if errors:
@@ -377,6 +618,32 @@ def fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=False):
     return combined_df
 
 
+@njit(cache=True, parallel=True)
+def points_in_ring(px, py, rx, ry):
+    """
+    Ray-crossing point-in-polygon test of every point against one closed ring.
+
+    Points exactly on the ring count as outside, matching the 'within' predicate.
+    """
+    n_vertices = rx.shape[0] - 1  # Ring is closed (last vertex repeats the first)
+    inside = np.zeros(px.shape[0], dtype=np.bool_)
+    for i in prange(px.shape[0]):
+        x, y = px[i], py[i]
+        crossings = 0
+        on_boundary = False
+        for j in range(n_vertices):
+            x0, y0, x1, y1 = rx[j], ry[j], rx[j + 1], ry[j + 1]
+            if (min(x0, x1) <= x <= max(x0, x1) and min(y0, y1) <= y <= max(y0, y1)
+                    and (x1 - x0) * (y - y0) == (y1 - y0) * (x - x0)):
+                on_boundary = True
+                break
+            if (y0 > y) != (y1 > y):
+                if x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+                    crossings += 1
+        inside[i] = not on_boundary and crossings % 2 == 1
+    return inside
+
+
 def clip_fires_to_aoi(fire_df, aoi):
     """
     Clip fire points to exact AOI polygon boundaries.
@@ -393,28 +660,668 @@ def clip_fires_to_aoi(fire_df, aoi):
 
     print("\nClipping fire points to AOI polygon...")
 
-    # Convert fire data to GeoDataFrame
-    geometry = [Point(lon, lat) for lon, lat in zip(fire_df['longitude'], fire_df['latitude'])]
+    # Convert fire data to GeoDataFrame (vectorized point construction)
+    geometry = gpd.points_from_xy(fire_df['longitude'].to_numpy(), fire_df['latitude'].to_numpy())
     fire_gdf_all = gpd.GeoDataFrame(fire_df, geometry=geometry, crs="EPSG:4326")
 
-    # Clip to AOI
-    fire_gdf_clipped = gpd.clip(fire_gdf_all, aoi)
+    # Filter to points inside the AOI. Only containment matters here, so an
+    # sindex-backed spatial join is much cheaper than gpd.clip's intersections.
+    # Dissolve multi-feature AOIs first so overlapping features don't duplicate points.
+    if len(aoi) > 1:
+        aoi = gpd.GeoDataFrame(geometry=[aoi.union_all()], crs=aoi.crs)
+    polygon = aoi.geometry.iloc[0]
+    if (polygon.geom_type == 'Polygon' and not polygon.interiors
+            and len(polygon.exterior.coords) <= PIP_MAX_VERTICES):
+        # Simple polygon (the common case): one compiled crossing-test pass over all points
+        ring = np.asarray(polygon.exterior.coords)
+        inside = points_in_ring(fire_df['longitude'].to_numpy(dtype=np.float64),
+                                fire_df['latitude'].to_numpy(dtype=np.float64),
+                                np.ascontiguousarray(ring[:, 0]), np.ascontiguousarray(ring[:, 1]))
+        fire_gdf_clipped = fire_gdf_all[inside]
+    else:
+        # Multipolygons and polygons with holes
+        fire_gdf_clipped = gpd.sjoin(
+            fire_gdf_all, aoi[['geometry']], predicate='within', how='inner'
+        ).drop(columns=['index_right'])
 
     print(f"Fire points within AOI: {len(fire_gdf_clipped)} (from {len(fire_gdf_all)} total)")
 
     return fire_gdf_all, fire_gdf_clipped
 
 
-def generate_daily_frames(fire_gdf, aoi, start_date, end_date, output_dir, basemap_style=None, interval='daily', dpi=80, overall_start=None, overall_end=None, weight_by='count', fire_gdf_all=None, cmap=None):
+@njit(cache=True)
+def bin_points_2d(x, y, w, xmin, ymin, dx, dy, grid_size):
+    """Accumulate weighted points into a (grid_size, grid_size) histogram (row = y, col = x)."""
+    grid = np.zeros((grid_size, grid_size))
+    for i in range(x.shape[0]):
+        ix = int(np.floor((x[i] - xmin) / dx))
+        iy = int(np.floor((y[i] - ymin) / dy))
+        if 0 <= ix < grid_size and 0 <= iy < grid_size:
+            grid[iy, ix] += w[i]
+    return grid
+
+
+def make_kde_grid(xlim, ylim, grid_size=KDE_GRID_SIZE):
+    """
+    Build the fixed density grid covering the map viewport.
+
+    Args:
+        xlim (tuple): (xmin, xmax) of the map axes
+        ylim (tuple): (ymin, ymax) of the map axes
+        grid_size (int): Number of cells per side
+
+    Returns:
+        dict: Grid origin, cell sizes and cell-center meshes for contouring
+    """
+    dx = (xlim[1] - xlim[0]) / grid_size
+    dy = (ylim[1] - ylim[0]) / grid_size
+    xx, yy = np.meshgrid(xlim[0] + (np.arange(grid_size) + 0.5) * dx,
+                         ylim[0] + (np.arange(grid_size) + 0.5) * dy)
+    return {'xmin': xlim[0], 'ymin': ylim[0], 'dx': dx, 'dy': dy, 'size': grid_size, 'xx': xx, 'yy': yy}
+
+
+def grid_kde(x, y, weights, grid, bw_adjust=0.15, levels=10, thresh=0.05):
+    """
+    Binned Gaussian KDE evaluated on a fixed grid.
+
+    Points are binned onto the grid and smoothed with a separable Gaussian, so the
+    cost is O(N + G^2) rather than O(N * G^2). Bandwidth follows Scott's rule scaled
+    by bw_adjust and contour levels are iso-proportions of the density mass, as in
+    seaborn's kdeplot. Unlike kdeplot, only the diagonal of the covariance is used
+    (the filter is separable), so kernels are axis-aligned ellipses: blobs do not
+    tilt to follow x/y correlation in the points.
+
+    Args:
+        x (np.ndarray): Point x coordinates
+        y (np.ndarray): Point y coordinates
+        weights (np.ndarray): Point weights (None for equal weights)
+        grid (dict): Grid from make_kde_grid
+        bw_adjust (float): Bandwidth scale factor
+        levels (int): Number of contour levels
+        thresh (float): Lowest iso-proportion level to draw
+
+    Returns:
+        tuple: (density, draw_levels) - density grid and increasing contour levels
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    w = np.ones_like(x) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    counts = bin_points_2d(x, y, w, grid['xmin'], grid['ymin'], grid['dx'], grid['dy'], grid['size'])
+
+    # Scott's rule for 2-D data, using the effective sample size for weighted points
+    n_eff = w.sum() ** 2 / (w ** 2).sum()
+    factor = n_eff ** (-1 / 6) * bw_adjust
+    cov = np.cov(np.vstack([x, y]), aweights=w)
+    # Per-axis kernel widths in grid cells; the x/y covariance term is ignored
+    sigma = (factor * np.sqrt(cov[1, 1]) / grid['dy'], factor * np.sqrt(cov[0, 0]) / grid['dx'])
+    density = gaussian_filter(counts, sigma=sigma, mode='constant')
+
+    # Convert iso-proportions of probability mass to density levels
+    sorted_values = np.sort(density, axis=None)[::-1]
+    normalized = np.cumsum(sorted_values) / sorted_values.sum()
+    idx = np.searchsorted(normalized, 1 - np.linspace(thresh, 1, levels))
+    draw_levels = np.take(sorted_values, idx, mode='clip')
+
+    return density, draw_levels
+
+
+def get_fire_arrays(fire_gdf):
+    """
+    Flatten fire points into date-sorted NumPy arrays.
+
+    Frames only need coordinates, dates and FRP, so these are extracted once as
+    plain arrays; each period is then a binary-search slice with no per-point
+    geometry access.
+
+    Args:
+        fire_gdf (gpd.GeoDataFrame): Fire points with an acq_date column
+
+    Returns:
+        dict: 'date' (datetime64[D]), 'x', 'y' and 'frp' (None if absent) arrays,
+            or None if there are no fires
+    """
+    if fire_gdf is None or fire_gdf.empty:
+        return None
+
+    dates = pd.to_datetime(fire_gdf['acq_date']).values.astype('datetime64[D]')
+    order = np.argsort(dates, kind='stable')
+    coords = shapely.get_coordinates(fire_gdf.geometry.values)[order]
+    return {
+        'date': dates[order],
+        'x': np.ascontiguousarray(coords[:, 0]),
+        'y': np.ascontiguousarray(coords[:, 1]),
+        'frp': fire_gdf['frp'].to_numpy(dtype=np.float64)[order] if 'frp' in fire_gdf.columns else None,
+    }
+
+
+def slice_fire_arrays(fires, period_start, period_end):
+    """
+    Select the fires detected between period_start and period_end (inclusive).
+
+    Args:
+        fires (dict): Arrays from get_fire_arrays
+        period_start (datetime): First day of the period
+        period_end (datetime): Last day of the period
+
+    Returns:
+        dict: Views of the arrays for the period, or None if fires is None
+    """
+    if fires is None:
+        return None
+    lo = np.searchsorted(fires['date'], np.datetime64(period_start, 'D'), 'left')
+    hi = np.searchsorted(fires['date'], np.datetime64(period_end, 'D'), 'right')
+    return {key: (values[lo:hi] if values is not None else None) for key, values in fires.items()}
+
+
+def get_period_ranges(fires, periods):
+    """
+    Locate every period's fires in the date-sorted arrays in one vectorized pass.
+
+    Args:
+        fires (dict): Arrays from get_fire_arrays, or None
+        periods (list): (period_start, period_end, label) tuples
+
+    Returns:
+        tuple: (lo, hi) index arrays; period i's fires are [lo[i]:hi[i]]
+    """
+    if fires is None:
+        empty = np.zeros(len(periods), dtype=np.intp)
+        return empty, empty
+    starts = np.array([p[0] for p in periods], dtype='datetime64[D]')
+    ends = np.array([p[1] for p in periods], dtype='datetime64[D]')
+    return np.searchsorted(fires['date'], starts, 'left'), np.searchsorted(fires['date'], ends, 'right')
+
+
+def get_viewport_bounds(bounds, padding=0.08):
+    """
+    Pad plot bounds on each side to get the map viewport.
+
+    Args:
+        bounds (array-like): (minx, miny, maxx, maxy) of the buffered AOI
+        padding (float): Fraction of the width/height added on each side
+
+    Returns:
+        tuple: (west, south, east, north) viewport bounds
+    """
+    padding_x = (bounds[2] - bounds[0]) * padding
+    padding_y = (bounds[3] - bounds[1]) * padding
+    return (bounds[0] - padding_x, bounds[1] - padding_y,
+            bounds[2] + padding_x, bounds[3] + padding_y)
+
+
+def fetch_basemap(bounds, basemap_style):
+    """
+    Fetch and stitch the basemap tiles for the map viewport once.
+
+    The viewport is identical for every frame, so the stitched image is reused
+    by all frames (and all render workers) instead of being fetched per figure.
+
+    Args:
+        bounds (array-like): Buffered AOI bounds in Web Mercator (EPSG:3857)
+        basemap_style (str): Basemap tile provider ('osm', 'satellite', 'terrain')
+
+    Returns:
+        tuple: (image, extent) for imshow, or None if the tiles could not be fetched
+    """
+    if basemap_style == 'satellite':
+        source = cx.providers.Esri.WorldImagery
+    elif basemap_style == 'terrain':
+        source = cx.providers.Stamen.Terrain
+    else:  # 'osm' or default
+        source = cx.providers.OpenStreetMap.Mapnik
+
+    west, south, east, north = get_viewport_bounds(bounds)
+    try:
+        img, extent = cx.bounds2img(west, south, east, north, zoom='auto', source=source)
+    except Exception as e:
+        print(f"\nWarning: Failed to add basemap: {e}")
+        print("Continuing without basemap...")
+        return None
+    return img, extent
+
+
+# Per-process frame rendering state, installed by init_frame_renderer
+_frame_context = None
+_frame_figure = None
+
+
+def init_frame_renderer(context):
+    """
+    Install the static rendering inputs for the current process.
+
+    Used as the ProcessPoolExecutor initializer, so the fire GeoDataFrames are
+    handed to each worker once instead of being pickled with every frame.
+    Also applies FRAME_RC_PARAMS, which workers do not inherit from the parent.
+
+    Args:
+        context (dict): Static rendering inputs built by generate_daily_frames
+    """
+    global _frame_context
+    close_frame_renderer()
+    plt.rcParams.update(FRAME_RC_PARAMS)
+    _frame_context = context
+
+
+def close_frame_renderer():
+    """Close the current process's reusable figure, if any."""
+    global _frame_figure
+    if _frame_figure is not None:
+        plt.close(_frame_figure['fig'])
+        _frame_figure = None
+
+
+def get_frame_crop(bbox, dpi, canvas_size):
+    """
+    Convert a figure bbox (inches) into an even-sized pixel crop of the canvas.
+
+    Args:
+        bbox (Bbox): Region to keep, in inches from the figure's bottom-left corner
+        dpi (int): Figure resolution
+        canvas_size (tuple): (width, height) of the canvas in pixels
+
+    Returns:
+        tuple: (row_slice, col_slice) into the canvas buffer
+    """
+    width, height = canvas_size
+    left = max(0, math.floor(bbox.x0 * dpi))
+    right = min(width, math.ceil(bbox.x1 * dpi))
+    top = max(0, height - math.ceil(bbox.y1 * dpi))
+    bottom = min(height, height - math.floor(bbox.y0 * dpi))
+
+    # H.264 (yuv420p) needs even dimensions; the canvas itself is even, so grow
+    # the crop by one pixel on whichever side has room
+    if (right - left) % 2:
+        right, left = (right + 1, left) if right < width else (right, left - 1)
+    if (bottom - top) % 2:
+        bottom, top = (bottom + 1, top) if bottom < height else (bottom, top - 1)
+
+    return slice(top, bottom), slice(left, right)
+
+
+def setup_frame_figure(context):
+    """
+    Create the figure reused for every frame rendered by this process.
+
+    Static content (layout, basemap, AOI outline, axis styling, bar chart) is drawn
+    once here; per frame only the heatmap/scatter artists, the stats text and the
+    bar highlight change.
+
+    Args:
+        context (dict): Static rendering inputs built by generate_daily_frames
+
+    Returns:
+        dict: Figure, axes and artist handles used by render_frame
+    """
+    bounds = context['bounds']
+    interval = context['interval']
+    dpi = context['dpi']
+    use_basemap = context['use_basemap']
+    basemap = context['basemap']
+    aoi_plot = context['aoi_plot']
+    weight_by = context['weight_by']
+    monthly_counts = context['monthly_counts']
+
+    if interval == 'monthly':
+        # Calculate aspect ratio from AOI bounds to minimize side whitespace
+        width_deg = bounds[2] - bounds[0]
+        height_deg = bounds[3] - bounds[1]
+        aspect_ratio = width_deg / height_deg
+
+        # Set figure dimensions based on aspect ratio
+        if aspect_ratio > 1.2:  # Wide area
+            fig_width, fig_height = 14, 10
+        elif aspect_ratio < 0.8:  # Tall area
+            fig_width, fig_height = 10, 12
+        else:  # Square-ish area
+            fig_width, fig_height = 12, 11
+
+        fig = plt.figure(figsize=(fig_width, fig_height), facecolor='#2b2b2b', dpi=dpi)
+        # Reduced bar chart height ratio and added border padding
+        # Symmetric margins to center the map perfectly
+        gs = fig.add_gridspec(2, 1, height_ratios=[8, 1], hspace=0.05,
+                             left=0.05, right=0.95, top=0.92, bottom=0.08)
+        ax_map = fig.add_subplot(gs[0], facecolor='#2b2b2b')
+        ax_bar = fig.add_subplot(gs[1], facecolor='#2b2b2b')
+        ax = ax_map  # Main plot is the map
+
+        # Force map to be perfectly centered by setting equal aspect
+        ax_map.set_aspect('equal', adjustable='box')
+    else:
+        fig, ax = plt.subplots(figsize=(12, 10), dpi=dpi)
+        ax_map = ax
+
+    # Round the canvas up to even pixel dimensions (required by H.264/yuv420p) so
+    # frames go to the encoder without padding
+    width_px, height_px = (round(size * dpi) for size in fig.get_size_inches())
+    fig.set_size_inches((width_px + width_px % 2) / dpi, (height_px + height_px % 2) / dpi)
+
+    # Padded viewport (prevents boundary touching video edges)
+    west, south, east, north = get_viewport_bounds(bounds)
+    ax.set_xlim(west, east)
+    ax.set_ylim(south, north)
+
+    # Draw the pre-fetched basemap image (drawn once, kept across frames)
+    if basemap is not None:
+        img, extent = basemap
+        ax.imshow(img, extent=extent, interpolation='bilinear', zorder=1)
+        # imshow autoscales to the image extent; restore the viewport
+        ax.set_xlim(west, east)
+        ax.set_ylim(south, north)
+
+    # Plot AOI boundary (lighter color for dark mode, high z-order to show on top)
+    aoi_plot.boundary.plot(ax=ax, color='#e0e0e0', linewidth=2.5, zorder=10)
+
+    # Set axis labels and styling
+    if use_basemap:
+        # Remove axis labels for cleaner map view
+        ax.set_xlabel('')
+        ax.set_ylabel('')
+        ax.set_xticks([])
+        ax.set_yticks([])
+    else:
+        ax.set_xlabel('Longitude', fontsize=12, color='#e0e0e0')
+        ax.set_ylabel('Latitude', fontsize=12, color='#e0e0e0')
+        ax.tick_params(colors='#e0e0e0')
+
+    # Styled info box (dark mode) - positioned further inside with clear whitespace
+    # Text is updated per frame (fixed layout to prevent jumping); zorder keeps it
+    # above the fire scatter points drawn later but below the AOI outline
+    stats_txt = ax.text(0.05, 0.95, '', transform=ax.transAxes,
+                        fontsize=12, verticalalignment='top', fontweight='600',
+                        color='#e0e0e0', family='monospace', zorder=3.5,
+                        bbox=dict(boxstyle='round,pad=0.6', facecolor='#3d3d3d',
+                                 edgecolor='#e74c3c', linewidth=2.5, alpha=0.95))
+
+    # Fire points, kept across frames (render_frame swaps in each period's offsets/sizes)
+    fire_points = ax.scatter(np.empty(0), np.empty(0), color='red', alpha=0.6, zorder=3)
+
+    # Add monthly bar chart for monthly interval (bar heights are fixed; only the highlight moves)
+    if interval == 'monthly':
+        # Create bar chart of monthly detections
+        months = list(monthly_counts.keys())
+        counts = list(monthly_counts.values())
+
+        # Create bars with modern styling
+        bars = ax_bar.bar(range(len(months)), counts, color='#95a5a6',
+                        edgecolor='#34495e', linewidth=1.2, alpha=0.85)
+
+        # Customize bar chart with dark mode styling
+        ylabel = 'FRP (MW)' if weight_by == 'frp' else 'Detections'
+        ax_bar.set_ylabel(ylabel, fontsize=11, fontweight='semibold', color='#e0e0e0')
+        ax_bar.set_xlim(-0.5, len(months) - 0.5)
+        ax_bar.grid(axis='y', alpha=0.2, linestyle='--', color='#666666', linewidth=0.8)
+        ax_bar.set_facecolor('#2b2b2b')
+        ax_bar.spines['top'].set_visible(False)
+        ax_bar.spines['right'].set_visible(False)
+        ax_bar.spines['left'].set_color('#666666')
+        ax_bar.spines['bottom'].set_color('#666666')
+        ax_bar.tick_params(colors='#e0e0e0')
+
+        # Format date labels (Aug '23 format)
+        # Set x-axis labels (show every Nth label to avoid crowding)
+        if len(months) <= 12:
+            step = 1
+        elif len(months) <= 24:
+            step = 2
+        elif len(months) <= 36:
+            step = 3
+        else:
+            step = 6
+
+        tick_positions = range(0, len(months), step)
+        # Convert YYYY-MM to Mmm 'YY format (vectorized over all tick months)
+        tick_labels = pd.to_datetime(np.asarray(months)[tick_positions], format='%Y-%m').strftime("%b '%y").tolist()
+        ax_bar.set_xticks(tick_positions)
+        ax_bar.set_xticklabels(tick_labels, rotation=45, ha='right', fontsize=9,
+                              color='#e0e0e0', fontweight='medium')
+
+        # Match bar chart width to map by adjusting margins
+        ax_bar.margins(x=0)
+
+        # CRITICAL: Perfect alignment - match bar chart to map's plot area.
+        # The layout is identical for every frame, so this is done once; apply_aspect
+        # resolves the equal-aspect map box without a full draw.
+        ax_map.apply_aspect()
+        map_bbox = ax_map.get_position()
+
+        # Set bar chart to match map's horizontal extent exactly
+        bar_bbox = ax_bar.get_position()
+        ax_bar.set_position([map_bbox.x0, bar_bbox.y0, map_bbox.width, bar_bbox.height])
+    else:
+        ax_bar = bars = months = None
+        plt.tight_layout(pad=0.3)
+
+    # Crop to content with minimal whitespace (as savefig(bbox_inches='tight') would).
+    # The layout is the same for every frame, so the box is measured once here and
+    # each frame is just a slice of the canvas buffer
+    fig.canvas.draw()
+    pad_inches = 0.15 if interval == 'monthly' else 0.1
+    tight_bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+
+    return {
+        'fig': fig,
+        'ax': ax,
+        # Density grid over the fixed viewport, shared by every frame's heatmap
+        'kde_grid': make_kde_grid(ax.get_xlim(), ax.get_ylim()),
+        'ax_map': ax_map,
+        'ax_bar': ax_bar,
+        'bars': bars,
+        'months': months,
+        'stats_txt': stats_txt,
+        'fire_points': fire_points,
+        # Everything drawn so far persists; anything added to the map later is per-frame
+        'static_collections': set(ax.collections),
+        'prev_idx': None,
+        'current_span': None,
+        'crop': get_frame_crop(tight_bbox, dpi, fig.canvas.get_width_height()),
+    }
+
+
+def render_frame(period):
+    """
+    Render a single period into an RGB frame using this process's reusable figure.
+
+    Args:
+        period (tuple): (period_start, period_end, label)
+
+    Returns:
+        np.ndarray: Frame as an (height, width, 3) uint8 array with even dimensions
+    """
+    global _frame_figure
+    if _frame_figure is None:
+        _frame_figure = setup_frame_figure(_frame_context)
+
+    context = _frame_context
+    frame = _frame_figure
+    fig, ax, ax_bar = frame['fig'], frame['ax'], frame['ax_bar']
+    bars, months = frame['bars'], frame['months']
+    fires = context['fires']
+    fires_all = context['fires_all']
+    interval = context['interval']
+    weight_by = context['weight_by']
+    cmap = context['cmap']
+    period_start, period_end, label = period
+
+    # Filter fires for this period (AOI fires); daily periods have period_end == period_start
+    period_fires = slice_fire_arrays(fires, period_start, period_end)
+    period_count = len(period_fires['x']) if period_fires is not None else 0
+    has_frp = period_fires is not None and period_fires['frp'] is not None
+
+    # Filter all fires for this period (including outside AOI)
+    period_fires_all = slice_fire_arrays(fires_all, period_start, period_end)
+
+    # Remove the previous frame's heatmap/scatter artists
+    for artist in [c for c in ax.collections if c not in frame['static_collections']]:
+        artist.remove()
+
+    # Plot fires - use all fires in bounding box with same color scheme
+    # Use period_fires_all if available, otherwise fall back to period_fires
+    fires_to_plot = period_fires_all if period_fires_all is not None and len(period_fires_all['x']) > 0 else period_fires
+    n_plot = len(fires_to_plot['x']) if fires_to_plot is not None else 0
+    x = fires_to_plot['x'] if n_plot else None
+    y = fires_to_plot['y'] if n_plot else None
+    frp_vals = fires_to_plot['frp'] if n_plot else None
+
+    if n_plot >= 3:
+        # Use KDE heatmap for sufficient points
+        try:
+            # Get weights if using FRP
+            if weight_by == 'frp' and frp_vals is not None:
+                weights = frp_vals
+                # Normalize weights to avoid extreme values
+                weights = weights / weights.max() if weights.max() > 0 else weights
+            else:
+                weights = None
+
+            # Create KDE plot (tighter kernels for more accurate representation)
+            kde_grid = frame['kde_grid']
+            density, draw_levels = grid_kde(x, y, weights, kde_grid, bw_adjust=0.15, levels=10)
+            ax.contourf(kde_grid['xx'], kde_grid['yy'], density, levels=draw_levels,
+                        cmap=cmap, alpha=0.4, zorder=2)
+
+            # Add scatter points (size by FRP if applicable)
+            if weight_by == 'frp' and frp_vals is not None:
+                # Scale point sizes by FRP (normalize for visibility)
+                sizes = 5 + (frp_vals / frp_vals.max() * 45) if frp_vals.max() > 0 else 15
+            else:
+                sizes = 15
+            edgecolor = 'none'
+
+        except Exception as e:
+            # Fallback to scatter if KDE fails
+            if weight_by == 'frp' and frp_vals is not None:
+                sizes = 10 + (frp_vals / frp_vals.max() * 90) if frp_vals.max() > 0 else 20
+            else:
+                sizes = 20
+            edgecolor = 'face'
+
+    elif n_plot > 0:
+        # Scatter plot for sparse data
+        if weight_by == 'frp' and frp_vals is not None:
+            sizes = 20 + (frp_vals / frp_vals.max() * 130) if frp_vals.max() > 0 else 50
+        else:
+            sizes = 50
+        edgecolor = 'face'
+
+    # Update the persistent fire point artist in place
+    fire_points = frame['fire_points']
+    if n_plot > 0:
+        fire_points.set_offsets(np.column_stack((x, y)))
+        fire_points.set_sizes(np.atleast_1d(sizes))
+        fire_points.set_edgecolor(edgecolor)
+    else:
+        fire_points.set_offsets(np.empty((0, 2)))
+
+    # Update statistics text (fixed layout to prevent jumping)
+    if interval == 'monthly':
+        month_name = period_start.strftime('%B')
+        year = period_start.strftime('%Y')
+
+        if weight_by == 'frp' and has_frp:
+            # Sum FRP values
+            total_frp = period_fires['frp'].sum()
+            value_text = f'{total_frp:,.0f} MW'
+            unit_label = 'Fire Radiative Power'
+        else:
+            # Count detections
+            value_text = f'{period_count:,}'
+            unit_label = 'Detections'
+
+        stats_text = f'{month_name} {year}\n{value_text} {unit_label}'
+    else:
+        if weight_by == 'frp' and has_frp:
+            total_frp = period_fires['frp'].sum()
+            stats_text = f'{total_frp:,.0f} MW'
+        else:
+            stats_text = f'{period_count:,} Detections'
+
+    frame['stats_txt'].set_text(stats_text)
+
+    # Move the bar chart highlight to the current month
+    if interval == 'monthly':
+        # Reset the previously highlighted bar
+        prev_idx = frame['prev_idx']
+        if prev_idx is not None:
+            bars[prev_idx].set_facecolor('#95a5a6')
+            bars[prev_idx].set_edgecolor('#34495e')
+            bars[prev_idx].set_linewidth(1.2)
+            bars[prev_idx].set_alpha(0.85)
+
+        # Highlight current bar with glow effect
+        current_idx = months.index(label)
+        bars[current_idx].set_facecolor('#e74c3c')
+        bars[current_idx].set_edgecolor('#c0392b')
+        bars[current_idx].set_linewidth(2.5)
+        bars[current_idx].set_alpha(1.0)
+        frame['prev_idx'] = current_idx
+
+        # Add subtle background highlight for current month
+        if frame['current_span'] is not None:
+            frame['current_span'].remove()
+        frame['current_span'] = ax_bar.axvspan(current_idx - 0.5, current_idx + 0.5,
+                                               alpha=0.15, color='#e74c3c', zorder=0)
+
+    # Rasterize the figure in memory (RGBA canvas buffer -> RGB array), cropped to
+    # the even-sized content box measured in setup_frame_figure
+    fig.canvas.draw()
+    rows, cols = frame['crop']
+    rgb = np.asarray(fig.canvas.buffer_rgba())[rows, cols, :3]
+
+    # Optionally save frame for inspection (here, so PNG encoding runs in parallel
+    # in the render workers rather than serially in the main process)
+    if context['output_dir'] is not None:
+        save_frame_png(rgb, get_frame_path(context['output_dir'], interval, period_start, label))
+
+    return rgb
+
+
+def save_frame_png(rgb, path):
+    """
+    Save a rendered frame as an RGB PNG for inspection.
+
+    Frames are kept as full RGB (not palette-quantized) so the saved PNG matches
+    the pixels sent to the encoder exactly.
+
+    Args:
+        rgb (np.ndarray): Frame as an (height, width, 3) uint8 array
+        path (Path): Output PNG path
+    """
+    # Fast zlib level: frames are debugging output, not archival
+    Image.fromarray(rgb).save(path, compress_level=1)
+
+
+def get_frame_path(output_dir, interval, period_start, label):
+    """
+    Build the PNG path for a frame saved with --keep-frames.
+
+    Args:
+        output_dir (Path): Directory for frame PNGs
+        interval (str): 'daily' or 'monthly'
+        period_start (datetime): First day of the frame's period
+        label (str): Period label (YYYY-MM for monthly frames)
+
+    Returns:
+        Path: Frame PNG path
+    """
+    if interval == 'monthly':
+        return output_dir / f"frame_{label}.png"
+    return output_dir / f"frame_{period_start.strftime('%Y%m%d')}.png"
+
+
+def generate_daily_frames(fire_gdf, aoi, start_date, end_date, output_dir=None, basemap_style=None, interval='daily', dpi=80, overall_start=None, overall_end=None, weight_by='count', fire_gdf_all=None, cmap=None, video_encoder=None, max_workers=None):
     """
     Generate heatmap frames at specified interval (daily or monthly).
 
+    Frames are rasterized in memory and streamed straight into the video encoder;
+    PNG files are only written when output_dir is given.
+
     Args:
         fire_gdf (gpd.GeoDataFrame): Clipped fire data (within AOI)
         aoi (gpd.GeoDataFrame): Area of interest
         start_date (datetime): Start date
         end_date (datetime): End date
-        output_dir (Path): Directory to save frames
+        output_dir (Path): Directory to save PNG frames (optional, for inspection)
         basemap_style (str): Basemap tile provider (None, 'osm', 'satellite', 'terrain')
         interval (str): Grouping interval - 'daily' or 'monthly'
         dpi (int): Resolution for frame rendering (lower = faster, default 80)
@@ -423,9 +1330,11 @@ def generate_daily_frames(fire_gdf, aoi, start_date, end_date, output_dir, basem
         weight_by (str): Weighting method - 'count' (frequency) or 'frp' (radiative power intensity)
         fire_gdf_all (gpd.GeoDataFrame): All fire data in bounding box (optional, for showing context)
         cmap: Colormap to use for heatmap (default: FIRE_CMAP)
+        video_encoder (VideoEncoder): Encoder that receives each rendered frame (optional)
+        max_workers (int): Maximum render processes (default: one per CPU; 1 renders in-process)
 
     Returns:
-        list: Paths to generated frame files
+        int: Number of frames rendered
     """
     # Use custom colormap if not specified
     if cmap is None:
@@ -435,8 +1344,9 @@ def generate_daily_frames(fire_gdf, aoi, start_date, end_date, output_dir, basem
         overall_start = start_date
     if overall_end is None:
         overall_end = end_date
-    output_dir.mkdir(exist_ok=True)
-    frame_files = []
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    frame_count = 0
 
     # Determine if we're using a basemap
     use_basemap = basemap_style is not None and HAS_CONTEXTILY
@@ -463,406 +1373,274 @@ def generate_daily_frames(fire_gdf, aoi, start_date, end_date, output_dir, basem
         fire_gdf_all_plot = fire_gdf_all
 
     # Get expanded bounds for viewport (buffer the AOI for rendering context)
-    # Use the same 25km buffer to match the API fetch area
+    # Use the same 25km buffer to match the API fetch area. The bounds of a buffered
+    # polygon are its bounds expanded by the buffer distance, so the (costly for
+    # detailed AOIs) buffer geometry itself is never built.
     if use_basemap:
         # Buffer in projected coordinates (meters)
-        aoi_buffered_for_plot = aoi_plot.buffer(25000)  # 25km in meters
-        bounds = aoi_buffered_for_plot.total_bounds
+        buffer_dist = 25000  # 25km in meters
     else:
         # Buffer in WGS84 (approximate degrees - ~0.225 degrees ≈ 25km at equator)
-        aoi_buffered_for_plot = aoi_plot.buffer(0.225)
-        bounds = aoi_buffered_for_plot.total_bounds
+        buffer_dist = 0.225
+    bounds = aoi_plot.total_bounds + np.array([-buffer_dist, -buffer_dist, buffer_dist, buffer_dist])
 
-    # Convert acq_date to datetime
-    if not fire_gdf_plot.empty:
-        fire_gdf_plot['acq_date'] = pd.to_datetime(fire_gdf_plot['acq_date'])
-    if fire_gdf_all_plot is not None and not fire_gdf_all_plot.empty:
-        fire_gdf_all_plot['acq_date'] = pd.to_datetime(fire_gdf_all_plot['acq_date'])
+    # Flatten (projected) fire points into date-sorted arrays once, so each period
+    # is a binary-search slice of contiguous coordinate arrays
+    fires = get_fire_arrays(fire_gdf_plot)
+    fires_all = get_fire_arrays(fire_gdf_all_plot)
 
     # Generate date periods based on interval
-    periods = []
     if interval == 'monthly':
-        # Generate monthly periods
-        current = start_date.replace(day=1)
-        while current <= end_date:
-            # Get last day of month
-            if current.month == 12:
-                next_month = current.replace(year=current.year + 1, month=1)
-            else:
-                next_month = current.replace(month=current.month + 1)
-            month_end = next_month - timedelta(days=1)
-
-            # Don't exceed end_date
-            period_end = min(month_end, end_date)
-            periods.append((current, period_end, current.strftime('%Y-%m')))
-
-            current = next_month
+        # Generate monthly periods (the first month starts on day 1 even if start_date doesn't)
+        month_starts = pd.date_range(start_date.replace(day=1), end_date, freq='MS')
+        month_ends = month_starts + pd.offsets.MonthEnd(0)
+        # Don't exceed end_date
+        month_ends = month_ends.where(month_ends <= end_date, pd.Timestamp(end_date))
+        periods = list(zip(month_starts, month_ends, month_starts.strftime('%Y-%m')))
     else:  # daily
-        current_date = start_date
-        while current_date <= end_date:
-            periods.append((current_date, current_date, current_date.strftime('%Y-%m-%d')))
-            current_date += timedelta(days=1)
+        days = pd.date_range(start_date, end_date, freq='D')
+        periods = list(zip(days, days, days.strftime('%Y-%m-%d')))
 
     print(f"\nGenerating {len(periods)} {interval} frames...")
 
     # Pre-calculate monthly fire counts/totals for the bar chart
+    # (one vectorized pass: all period bounds are located in the sorted dates at once)
     monthly_counts = {}
-    if interval == 'monthly' and not fire_gdf_plot.empty:
-        for period_start, period_end, label in periods:
-            month_fires = fire_gdf_plot[
-                (fire_gdf_plot['acq_date'] >= period_start) &
-                (fire_gdf_plot['acq_date'] <= period_end)
-            ]
-            if weight_by == 'frp':
-                # Sum of FRP values (MW)
-                monthly_counts[label] = month_fires['frp'].sum() if 'frp' in month_fires.columns else 0
+    if interval == 'monthly' and fires is not None:
+        labels = [label for _, _, label in periods]
+        lo, hi = get_period_ranges(fires, periods)
+        if weight_by == 'frp':
+            # Sum of FRP values (MW), from differences of the running total
+            if fires['frp'] is not None:
+                frp_cumsum = np.concatenate(([0.0], np.cumsum(fires['frp'], dtype=np.float64)))
+                values = frp_cumsum[hi] - frp_cumsum[lo]
             else:
-                # Count of detections
-                monthly_counts[label] = len(month_fires)
+                values = np.zeros(len(periods))
+        else:
+            # Count of detections
+            values = hi - lo
+        monthly_counts = dict(zip(labels, values.tolist()))
     elif interval == 'monthly':
         # All zeros if no fire data
         for period_start, period_end, label in periods:
             monthly_counts[label] = 0
 
-    for period_start, period_end, label in tqdm(periods, desc="Rendering frames"):
-        # Filter fires for this period (AOI fires)
-        if not fire_gdf_plot.empty:
-            if interval == 'monthly':
-                # Get all fires within the month
-                period_fires = fire_gdf_plot[
-                    (fire_gdf_plot['acq_date'] >= period_start) &
-                    (fire_gdf_plot['acq_date'] <= period_end)
-                ]
-            else:  # daily
-                period_fires = fire_gdf_plot[fire_gdf_plot['acq_date'] == period_start]
-        else:
-            period_fires = gpd.GeoDataFrame()
-
-        # Filter all fires for this period (including outside AOI)
-        if fire_gdf_all_plot is not None and not fire_gdf_all_plot.empty:
-            if interval == 'monthly':
-                period_fires_all = fire_gdf_all_plot[
-                    (fire_gdf_all_plot['acq_date'] >= period_start) &
-                    (fire_gdf_all_plot['acq_date'] <= period_end)
-                ]
-            else:  # daily
-                period_fires_all = fire_gdf_all_plot[fire_gdf_all_plot['acq_date'] == period_start]
-        else:
-            period_fires_all = None
-
-        # Create figure with subplots (map on top, bar chart on bottom for monthly interval)
-        if interval == 'monthly':
-            # Calculate aspect ratio from AOI bounds to minimize side whitespace
-            width_deg = bounds[2] - bounds[0]
-            height_deg = bounds[3] - bounds[1]
-            aspect_ratio = width_deg / height_deg
-
-            # Set figure dimensions based on aspect ratio
-            if aspect_ratio > 1.2:  # Wide area
-                fig_width, fig_height = 14, 10
-            elif aspect_ratio < 0.8:  # Tall area
-                fig_width, fig_height = 10, 12
-            else:  # Square-ish area
-                fig_width, fig_height = 12, 11
-
-            fig = plt.figure(figsize=(fig_width, fig_height), facecolor='#2b2b2b')
-            # Reduced bar chart height ratio and added border padding
-            # Symmetric margins to center the map perfectly
-            gs = fig.add_gridspec(2, 1, height_ratios=[8, 1], hspace=0.05,
-                                 left=0.05, right=0.95, top=0.92, bottom=0.08)
-            ax_map = fig.add_subplot(gs[0], facecolor='#2b2b2b')
-            ax_bar = fig.add_subplot(gs[1], facecolor='#2b2b2b')
-            ax = ax_map  # Main plot is the map
-
-            # Force map to be perfectly centered by setting equal aspect
-            ax_map.set_aspect('equal', adjustable='box')
-        else:
-            fig, ax = plt.subplots(figsize=(12, 10))
-
-        # CRITICAL: Set axis limits BEFORE adding basemap so it knows what area to fetch
-        # Add 8% padding on each side to prevent boundary touching video edges
-        x_range = bounds[2] - bounds[0]
-        y_range = bounds[3] - bounds[1]
-        padding_x = x_range * 0.08
-        padding_y = y_range * 0.08
-        ax.set_xlim(bounds[0] - padding_x, bounds[2] + padding_x)
-        ax.set_ylim(bounds[1] - padding_y, bounds[3] + padding_y)
-
-        # Add basemap if requested
-        if use_basemap:
-            # Add basemap tiles (axis limits already set above)
-            try:
-                if basemap_style == 'satellite':
-                    cx.add_basemap(ax, source=cx.providers.Esri.WorldImagery, attribution="")
-                elif basemap_style == 'terrain':
-                    cx.add_basemap(ax, source=cx.providers.Stamen.Terrain, attribution="")
-                else:  # 'osm' or default
-                    cx.add_basemap(ax, source=cx.providers.OpenStreetMap.Mapnik, attribution="")
-            except Exception as e:
-                print(f"\nWarning: Failed to add basemap: {e}")
-                print("Continuing without basemap for this frame...")
-
-        # Plot AOI boundary (lighter color for dark mode, high z-order to show on top)
-        aoi_plot.boundary.plot(ax=ax, color='#e0e0e0', linewidth=2.5, zorder=10)
-
-        # Plot fires - use all fires in bounding box with same color scheme
-        # Use period_fires_all if available, otherwise fall back to period_fires
-        fires_to_plot = period_fires_all if period_fires_all is not None and len(period_fires_all) > 0 else period_fires
-
-        if len(fires_to_plot) >= 3:
-            # Use KDE heatmap for sufficient points
-            try:
-                # Extract coordinates
-                x = fires_to_plot.geometry.x.values
-                y = fires_to_plot.geometry.y.values
-
-                # Get weights if using FRP
-                if weight_by == 'frp' and 'frp' in fires_to_plot.columns:
-                    weights = fires_to_plot['frp'].values
-                    # Normalize weights to avoid extreme values
-                    weights = weights / weights.max() if weights.max() > 0 else weights
-                else:
-                    weights = None
-
-                # Create KDE plot (tighter kernels for more accurate representation)
-                sns.kdeplot(
-                    x=x, y=y,
-                    weights=weights,
-                    cmap=cmap, fill=True, alpha=0.4,
-                    levels=10, ax=ax, bw_adjust=0.15, zorder=2
-                )
-
-                # Add scatter points (size by FRP if applicable)
-                if weight_by == 'frp' and 'frp' in fires_to_plot.columns:
-                    # Scale point sizes by FRP (normalize for visibility)
-                    frp_vals = fires_to_plot['frp'].values
-                    sizes = 5 + (frp_vals / frp_vals.max() * 45) if frp_vals.max() > 0 else 15
-                    ax.scatter(x, y, c='red', s=sizes, alpha=0.6, edgecolors='none', zorder=3)
-                else:
-                    ax.scatter(x, y, c='red', s=15, alpha=0.6, edgecolors='none', zorder=3)
-
-            except Exception as e:
-                # Fallback to scatter if KDE fails
-                if weight_by == 'frp' and 'frp' in fires_to_plot.columns:
-                    frp_vals = fires_to_plot['frp'].values
-                    sizes = 10 + (frp_vals / frp_vals.max() * 90) if frp_vals.max() > 0 else 20
-                    fires_to_plot.plot(ax=ax, color='red', markersize=sizes, alpha=0.6, zorder=3)
-                else:
-                    fires_to_plot.plot(ax=ax, color='red', markersize=20, alpha=0.6, zorder=3)
-
-        elif len(fires_to_plot) > 0:
-            # Scatter plot for sparse data
-            if weight_by == 'frp' and 'frp' in fires_to_plot.columns:
-                frp_vals = fires_to_plot['frp'].values
-                sizes = 20 + (frp_vals / frp_vals.max() * 130) if frp_vals.max() > 0 else 50
-                fires_to_plot.plot(ax=ax, color='red', markersize=sizes, alpha=0.6, zorder=3)
-            else:
-                fires_to_plot.plot(ax=ax, color='red', markersize=50, alpha=0.6, zorder=3)
-
-        # Set axis labels and styling
-        if use_basemap:
-            # Remove axis labels for cleaner map view
-            ax.set_xlabel('')
-            ax.set_ylabel('')
-            ax.set_xticks([])
-            ax.set_yticks([])
-        else:
-            ax.set_xlabel('Longitude', fontsize=12, color='#e0e0e0')
-            ax.set_ylabel('Latitude', fontsize=12, color='#e0e0e0')
-            ax.tick_params(colors='#e0e0e0')
-
-
-        # Add statistics text with modern styling (fixed layout to prevent jumping)
-        if interval == 'monthly':
-            month_name = period_start.strftime('%B')
-            year = period_start.strftime('%Y')
-
-            if weight_by == 'frp' and 'frp' in period_fires.columns:
-                # Sum FRP values
-                total_frp = period_fires['frp'].sum()
-                value_text = f'{total_frp:,.0f} MW'
-                unit_label = 'Fire Radiative Power'
-            else:
-                # Count detections
-                value_text = f'{len(period_fires):,}'
-                unit_label = 'Detections'
+    # Static inputs shared by every frame (sent to each render worker once)
+    context = {
+        'fires': fires,
+        'fires_all': fires_all,
+        'aoi_plot': aoi_plot,
+        'bounds': bounds,
+        'use_basemap': use_basemap,
+        'basemap': fetch_basemap(bounds, basemap_style) if use_basemap else None,
+        'interval': interval,
+        'dpi': dpi,
+        'weight_by': weight_by,
+        'cmap': cmap,
+        'monthly_counts': monthly_counts,
+        # Frames are saved as PNGs by the process that renders them
+        'output_dir': output_dir,
+    }
+
+    # Daily frames with no fires at all are identical (no month label or bar chart),
+    # so only the first one is rendered and the rest reuse it
+    if interval == 'daily':
+        lo, hi = get_period_ranges(fires, periods)
+        lo_all, hi_all = get_period_ranges(fires_all, periods)
+        empty = (hi == lo) & (hi_all == lo_all)
+    else:
+        empty = np.zeros(len(periods), dtype=bool)
+    reuse_empty = empty & (np.cumsum(empty) > 1)
+    render_periods = [period for period, reuse in zip(periods, reuse_empty) if not reuse]
+
+    # Frames are independent, so render them in parallel worker processes (each
+    # with its own reusable figure). executor.map yields results in period order,
+    # which keeps the video stream ordered. Workers are only started when each
+    # gets enough frames to pay back its startup cost.
+    workers = min(max_workers or os.cpu_count() or 1, len(render_periods) // MIN_FRAMES_PER_WORKER)
+    executor = None
+    if workers > 1:
+        # Workers come from a forkserver (or are spawned where forkserver is unavailable,
+        # e.g. Windows), never a fork of this process: the encoder thread and Numba's
+        # thread pool are already running here and are not fork-safe
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method),
+                                       initializer=init_frame_renderer, initargs=(context,))
+        # Batch periods per task to cut IPC round trips, keeping ~4 batches per worker
+        # so the load stays balanced
+        chunksize = max(1, len(render_periods) // (workers * 4))
+        frames = executor.map(render_frame, render_periods, chunksize=chunksize)
+    else:
+        init_frame_renderer(context)
+        frames = map(render_frame, render_periods)
 
-            stats_text = f'{month_name} {year}\n{value_text} {unit_label}'
-        else:
-            if weight_by == 'frp' and 'frp' in period_fires.columns:
-                total_frp = period_fires['frp'].sum()
-                stats_text = f'{total_frp:,.0f} MW'
-            else:
-                stats_text = f'{len(period_fires):,} Detections'
-
-        # Styled info box (dark mode) - positioned further inside with clear whitespace
-        ax.text(0.05, 0.95, stats_text, transform=ax.transAxes,
-                fontsize=12, verticalalignment='top', fontweight='600',
-                color='#e0e0e0', family='monospace',
-                bbox=dict(boxstyle='round,pad=0.6', facecolor='#3d3d3d',
-                         edgecolor='#e74c3c', linewidth=2.5, alpha=0.95))
-
-        # Add monthly bar chart for monthly interval
-        if interval == 'monthly':
-            # CRITICAL: Perfect alignment - match bar chart to map's plot area
-            fig.canvas.draw()  # Force render to get actual positions
-
-            # Get the actual plot area of the map (excluding labels)
-            map_bbox = ax_map.get_window_extent().transformed(fig.transFigure.inverted())
-
-            # Set bar chart to match map's horizontal extent exactly
-            bar_bbox = ax_bar.get_position()
-            ax_bar.set_position([map_bbox.x0, bar_bbox.y0, map_bbox.width, bar_bbox.height])
-
-            # Create bar chart of monthly detections
-            months = list(monthly_counts.keys())
-            counts = list(monthly_counts.values())
-
-            # Beautiful gradient colors - current month highlighted
-            current_idx = months.index(label)
-            colors = ['#e74c3c' if i == current_idx else '#95a5a6' for i in range(len(months))]
-
-            # Create bars with modern styling
-            bars = ax_bar.bar(range(len(months)), counts, color=colors,
-                            edgecolor='#34495e', linewidth=1.2, alpha=0.85)
-
-            # Highlight current bar with glow effect
-            bars[current_idx].set_edgecolor('#c0392b')
-            bars[current_idx].set_linewidth(2.5)
-            bars[current_idx].set_alpha(1.0)
-
-            # Customize bar chart with dark mode styling
-            ylabel = 'FRP (MW)' if weight_by == 'frp' else 'Detections'
-            ax_bar.set_ylabel(ylabel, fontsize=11, fontweight='semibold', color='#e0e0e0')
-            ax_bar.set_xlim(-0.5, len(months) - 0.5)
-            ax_bar.grid(axis='y', alpha=0.2, linestyle='--', color='#666666', linewidth=0.8)
-            ax_bar.set_facecolor('#2b2b2b')
-            ax_bar.spines['top'].set_visible(False)
-            ax_bar.spines['right'].set_visible(False)
-            ax_bar.spines['left'].set_color('#666666')
-            ax_bar.spines['bottom'].set_color('#666666')
-            ax_bar.tick_params(colors='#e0e0e0')
-
-            # Format date labels (Aug '23 format)
-            def format_month_label(month_str):
-                """Convert YYYY-MM to Mmm 'YY format"""
-                dt = datetime.strptime(month_str, '%Y-%m')
-                return dt.strftime("%b '%y")
-
-            # Set x-axis labels (show every Nth label to avoid crowding)
-            if len(months) <= 12:
-                step = 1
-            elif len(months) <= 24:
-                step = 2
-            elif len(months) <= 36:
-                step = 3
+    empty_rgb = empty_file = None
+    try:
+        for (period_start, period_end, label), is_empty, reuse in tqdm(zip(periods, empty, reuse_empty),
+                                                                      total=len(periods),
+                                                                      desc="Rendering frames"):
+            frame_file = get_frame_path(output_dir, interval, period_start, label) if output_dir is not None else None
+            if reuse:
+                rgb = empty_rgb
+                if frame_file is not None:
+                    shutil.copyfile(empty_file, frame_file)
             else:
-                step = 6
-
-            tick_positions = range(0, len(months), step)
-            tick_labels = [format_month_label(months[i]) for i in tick_positions]
-            ax_bar.set_xticks(tick_positions)
-            ax_bar.set_xticklabels(tick_labels, rotation=45, ha='right', fontsize=9,
-                                  color='#e0e0e0', fontweight='medium')
-
-            # Add subtle background highlight for current month
-            ax_bar.axvspan(current_idx - 0.5, current_idx + 0.5,
-                          alpha=0.15, color='#e74c3c', zorder=0)
-
-            # Match bar chart width to map by adjusting margins
-            ax_bar.margins(x=0)
-
-        # Save frame
-        if interval == 'monthly':
-            frame_file = output_dir / f"frame_{label}.png"
-        else:
-            frame_file = output_dir / f"frame_{period_start.strftime('%Y%m%d')}.png"
-
-        # Save with minimal whitespace - bbox_inches='tight' crops to content
-        if interval == 'monthly':
-            # Use bbox_inches='tight' to crop whitespace around map
-            plt.savefig(frame_file, dpi=dpi, bbox_inches='tight', pad_inches=0.15)
+                rgb = next(frames)
+                if is_empty:
+                    # Copy: in-process frames are views of the reused canvas buffer
+                    empty_rgb = rgb.copy()
+                    empty_file = frame_file
+
+            if video_encoder is not None:
+                video_encoder.write(rgb)
+
+            frame_count += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
         else:
-            plt.tight_layout(pad=0.3)
-            plt.savefig(frame_file, dpi=dpi, bbox_inches='tight', pad_inches=0.1)
-        plt.close(fig)
-
-        # Ensure even dimensions for H.264 codec (required by libx264)
-        img = Image.open(frame_file)
-        width, height = img.size
-
-        # Pad to even dimensions if needed
-        new_width = width if width % 2 == 0 else width + 1
-        new_height = height if height % 2 == 0 else height + 1
-
-        if new_width != width or new_height != height:
-            new_img = Image.new('RGB', (new_width, new_height), (255, 255, 255))
-            new_img.paste(img, (0, 0))
-            new_img.save(frame_file)
-        elif img.mode != 'RGB':
-            # Also ensure RGB mode
-            img.convert('RGB').save(frame_file)
-
-        frame_files.append(frame_file)
+            close_frame_renderer()
 
-    return frame_files
+    return frame_count
 
 
-def compile_video(frame_files, output_path, fps=3, hold_last_frame=3):
+def select_video_codec(encoder='auto'):
     """
-    Compile frames into MP4 video.
+    Pick the H.264 encoder to use, preferring hardware encoders when available.
 
     Args:
-        frame_files (list): List of frame file paths
-        output_path (str): Output video file path
-        fps (int): Frames per second
-        hold_last_frame (int): Number of extra frames to hold the last frame (default: 3)
+        encoder (str): 'auto' or an explicit codec name from VIDEO_CODEC_OPTIONS
+
+    Returns:
+        str: Codec name
     """
-    print(f"\nCompiling video: {output_path}")
-    print(f"Total frames: {len(frame_files)}, FPS: {fps}")
-
-    # Read frames and write video
-    frames = []
-    for frame_file in tqdm(frame_files, desc="Loading frames"):
-        frames.append(iio.imread(frame_file))
-
-    # Hold the last frame for a few extra frames to avoid abrupt ending
-    if frames and hold_last_frame > 0:
-        last_frame = frames[-1]
-        for _ in range(hold_last_frame):
-            frames.append(last_frame)
-
-    # Write video with H.264 codec
-    iio.imwrite(
-        output_path,
-        frames,
-        fps=fps,
-        codec='libx264',
-        quality=8,
-        macro_block_size=1
-    )
+    if encoder != 'auto':
+        return encoder
 
-    print(f"Video saved: {output_path}")
+    # A codec can be compiled into FFmpeg without usable hardware behind it,
+    # so actually open a tiny encoder context to confirm it works
+    for codec in ('h264_nvenc', 'h264_videotoolbox'):
+        try:
+            ctx = av.CodecContext.create(codec, 'w')
+            ctx.width, ctx.height = 256, 256
+            ctx.pix_fmt = 'yuv420p'
+            ctx.time_base = Fraction(1, 30)
+            ctx.options = VIDEO_CODEC_OPTIONS[codec]
+            ctx.open()
+            return codec
+        except Exception:
+            continue
+    return 'libx264'
 
-    # Calculate video duration (including held frames)
-    total_frames = len(frame_files) + hold_last_frame
-    duration = total_frames / fps
-    print(f"Video duration: {duration:.1f} seconds ({total_frames} frames)")
 
+class VideoEncoder:
+    """Encodes RGB frames into an H.264 MP4 as they are rendered, without intermediate files.
 
-def cleanup_frames(frame_dir):
+    Encoding runs on a background thread so rasterizing the next frame overlaps
+    encoding of the previous one. With scale != 1, frames are resized (Lanczos,
+    libswscale) on that thread, so a low-DPI render can still give a large video.
     """
-    Remove temporary frame files.
 
-    Args:
-        frame_dir (Path): Directory containing frames
-    """
-    print("\nCleaning up temporary frames...")
+    def __init__(self, output_path, fps=3, codec='libx264', scale=1.0):
+        self.output_path = output_path
+        self.fps = fps
+        self.codec = codec
+        self.scale = scale
+        self.frame_count = 0
+        self._container = av.open(str(output_path), mode='w')
+        self._stream = None
+        self._last_packet = None
+        self._max_pts = None
+        self._error = None
+        self._queue = queue.Queue(maxsize=4)
+        self._thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self._thread.start()
+
+    def _encode_loop(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            if self._error is not None:
+                continue  # Drain remaining frames after a failure
+            try:
+                if (frame.width, frame.height) != (self._stream.width, self._stream.height):
+                    frame = frame.reformat(self._stream.width, self._stream.height,
+                                           format='yuv420p', interpolation='LANCZOS')
+                # The newest packet is held back so close() can extend its duration
+                packets = self._stream.encode(frame)
+                if packets:
+                    self._track_max_pts(packets)
+                    if self._last_packet is not None:
+                        packets.insert(0, self._last_packet)
+                    self._container.mux(packets[:-1])
+                    self._last_packet = packets[-1]
+            except Exception as e:
+                self._error = e
 
-    for frame_file in frame_dir.glob("*.png"):
-        frame_file.unlink()
+    def _track_max_pts(self, packets):
+        for packet in packets:
+            if packet.pts is not None and (self._max_pts is None or packet.pts > self._max_pts):
+                self._max_pts = packet.pts
 
-    frame_dir.rmdir()
+    def write(self, rgb):
+        """
+        Queue a single frame for encoding.
+
+        Args:
+            rgb (np.ndarray): Frame as an (height, width, 3) uint8 array with even dimensions
+        """
+        if self._error is not None:
+            raise self._error
+
+        if self._stream is None:
+            # Stream dimensions are fixed by the first frame (scaled, kept even for yuv420p)
+            height, width = rgb.shape[:2]
+            self._stream = self._container.add_stream(self.codec, rate=self.fps)
+            self._stream.width = 2 * round(width * self.scale / 2)
+            self._stream.height = 2 * round(height * self.scale / 2)
+            self._stream.pix_fmt = 'yuv420p'
+            self._stream.options = VIDEO_CODEC_OPTIONS.get(self.codec, {})
+            # Auto thread count with frame threading (PyAV defaults to slice threading,
+            # which makes libx264 fall back to its less efficient sliced-threads mode)
+            self._stream.thread_count = 0
+            self._stream.thread_type = 'AUTO'
+
+        # from_ndarray copies the pixels, so the caller may reuse its buffer immediately
+        frame = av.VideoFrame.from_ndarray(rgb, format='rgb24')
+        self._queue.put(frame)
+        self.frame_count += 1
+
+    def close(self, hold_last_frame=3):
+        """
+        Flush the encoder and finalize the MP4 file.
+
+        Args:
+            hold_last_frame (int): Number of extra frames to hold the last frame (default: 3)
+        """
+        try:
+            self._queue.put(None)
+            self._thread.join()
+            if self._stream is not None and self._error is None:
+                packets = self._stream.encode()
+                self._track_max_pts(packets)
+                if self._last_packet is not None:
+                    packets.insert(0, self._last_packet)
+                if packets:
+                    # Hold the last frame for a few extra frames to avoid abrupt ending.
+                    # The stream ends where the final packet (in decode order, which may
+                    # be a B-frame shown before the last frame) ends, so stretching it
+                    # holds the last frame without encoding duplicates
+                    last = packets[-1]
+                    hold = round((1 + hold_last_frame) / (self.fps * last.time_base))
+                    last.duration = self._max_pts - last.pts + hold
+                    self._container.mux(packets)
+                    self.frame_count += hold_last_frame  # Counted as shown, though not encoded
+        finally:
+            self._container.close()
+
+        if self._error is not None:
+            raise self._error
 
 
 def validate_dates(start_str, end_str):
@@ -923,19 +1701,32 @@ Examples:
                         help='Frames per second (default: 3, slower for better viewing)')
     parser.add_argument('--cache', action='store_true',
                         help='Cache API responses for development')
+    parser.add_argument('--cache-format', choices=['parquet', 'csv'], default='parquet',
+                        help='Cache file format (default: parquet). Use csv for plain-text cache files.')
     parser.add_argument('--keep-frames', action='store_true',
-                        help='Keep temporary frame files after video generation')
+                        help='Also save each frame as a PNG in outputs/frames_frequency (for debugging)')
     parser.add_argument('--basemap', choices=['osm', 'satellite', 'terrain', 'none'], default='satellite',
                         help='Basemap overlay (default: satellite). '
                              'Options: osm, satellite, terrain, none. Requires contextily: uv add contextily')
     parser.add_argument('--interval', choices=['daily', 'monthly'], default='monthly',
                         help='Time interval for frame grouping (default: monthly). '
                              'Use "daily" for day-by-day viewing.')
+    parser.add_argument('--encoder', choices=['auto'] + list(VIDEO_CODEC_OPTIONS), default='auto',
+                        help='H.264 encoder (default: auto - use NVENC/VideoToolbox hardware encoding when available, else libx264)')
     parser.add_argument('--dpi', type=int, default=80,
                         help='Frame resolution in DPI (default: 80). Higher = better quality but slower. Try 60 for speed, 100+ for quality.')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Resize frames by this factor when encoding (default: 1.0). E.g. --dpi 60 --scale 1.5 '
+                             'renders fast at low DPI and upscales to the size of a 90 DPI video.')
+    parser.add_argument('--singlecore', action='store_true',
+                        help='Render all frames in the main process (for debugging/profiling)')
 
     args = parser.parse_args()
 
+    if args.scale <= 0:
+        print("ERROR: --scale must be greater than 0", file=sys.stderr)
+        sys.exit(1)
+
     # Generate default output filename based on input if not specified
     if args.output is None:
         input_filename = Path(args.geojson).stem  # Get filename without extension
@@ -957,6 +1748,10 @@ Examples:
     if args.basemap == 'none':
         args.basemap = None
 
+    # Persist basemap tiles alongside the API cache so reruns skip the tile downloads
+    if args.cache and args.basemap:
+        cx.set_cache_dir(CACHE_DIR / 'tiles')
+
     # Validate inputs
     start_date, end_date = validate_dates(args.start_date, args.end_date)
     map_key = get_map_key()
@@ -969,28 +1764,18 @@ Examples:
     print(f"Bounding box (with 25km buffer): {bbox}")
 
     # Fetch fire data
-    print(f"\n[1/4] Fetching fire data...")
+    print(f"\n[1/3] Fetching fire data...")
     t1 = time.time()
-    fire_df = fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=args.cache)
+    fire_df = fetch_fire_data(map_key, bbox, start_date, end_date, use_cache=args.cache,
+                              cache_format=args.cache_format)
     print(f"✓ Data fetch completed in {time.time() - t1:.1f}s")
 
     # Clip to AOI
-    print(f"\n[2/4] Processing spatial data...")
+    print(f"\n[2/3] Processing spatial data...")
     t2 = time.time()
     fire_gdf_all, fire_gdf = clip_fires_to_aoi(fire_df, aoi)
     print(f"✓ Spatial processing completed in {time.time() - t2:.1f}s")
 
-    # Generate frames with custom colormap
-    print(f"\n[3/4] Rendering frames (DPI={args.dpi})...")
-    t3 = time.time()
-    frames_dir = Path("outputs/frames_frequency")
-    frames_dir.mkdir(parents=True, exist_ok=True)
-    frame_files = generate_daily_frames(fire_gdf, aoi, start_date, end_date, frames_dir,
-                                       basemap_style=args.basemap, interval=args.interval,
-                                       dpi=args.dpi, overall_start=start_date, overall_end=end_date,
-                                       weight_by='count', fire_gdf_all=fire_gdf_all, cmap='gnuplot2')
-    print(f"✓ Frame rendering completed in {time.time() - t3:.1f}s")
-
     # Generate output filename with format: OUTPUT_{StartDate}_{EndDate}_{AOI_name}.mp4
     input_filename = Path(args.geojson).stem
     start_str = start_date.strftime("%Y-%m-%d")
@@ -1000,16 +1785,29 @@ Examples:
     output_dir = output_path.parent
     output_video = output_dir / f"OUTPUT_{start_str}_{end_str}_{input_filename}.mp4"
 
-    print(f"\n[4/4] Compiling video...")
-    t4 = time.time()
+    # Render frames with custom colormap, streaming each one straight into the encoder
+    print(f"\n[3/3] Rendering frames and encoding video (DPI={args.dpi})...")
+    t3 = time.time()
     output_dir.mkdir(parents=True, exist_ok=True)
-    compile_video(frame_files, str(output_video), fps=args.fps)
-    print(f"✓ Video compilation completed in {time.time() - t4:.1f}s")
+    frames_dir = Path("outputs/frames_frequency") if args.keep_frames else None
+    codec = select_video_codec(args.encoder)
+    print(f"Video encoder: {codec}")
+    encoder = VideoEncoder(output_video, fps=args.fps, codec=codec, scale=args.scale)
+    try:
+        generate_daily_frames(fire_gdf, aoi, start_date, end_date, frames_dir,
+                              basemap_style=args.basemap, interval=args.interval,
+                              dpi=args.dpi, overall_start=start_date, overall_end=end_date,
+                              weight_by='count', fire_gdf_all=fire_gdf_all, cmap='gnuplot2',
+                              video_encoder=encoder, max_workers=1 if args.singlecore else None)
+    finally:
+        encoder.close()
+    print(f"✓ Rendering and encoding completed in {time.time() - t3:.1f}s")
 
-    # Cleanup
-    if not args.keep_frames:
-        cleanup_frames(frames_dir)
-    else:
+    # Calculate video duration (including held frames)
+    duration = encoder.frame_count / args.fps
+    print(f"Video duration: {duration:.1f} seconds ({encoder.frame_count} frames at {args.fps} FPS)")
+
+    if frames_dir is not None:
         print(f"\nFrames saved in: {frames_dir}")
 
     total_time = time.time() - t0